@@ -1,21 +1,81 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import httpx
+import orjson
 
-app = FastAPI()
+from wiki import OutlineError, build_outline, lifespan
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Enable CORS for all origins
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["GET", "HEAD", "POST", "OPTIONS"],
+    allow_headers=["*"],
+)
+
+DATA_PREFIX = "data:"
+VALID_TYPES = frozenset(("image", "text", "application"))
+
+# Constant bodies for the root and health check routes, serialized once
+HOME_BODY = b"GlobalEdu Country Outline API - Ready"
+HEALTH_BODY = orjson.dumps({"status": "ok"})
 
 class AttachmentRequest(BaseModel):
     attachments: dict
 
+# ✅ Root route - returns plain text (not JSON)
+@app.get("/", response_class=PlainTextResponse)
+def home():
+    return PlainTextResponse(HOME_BODY)
+
+# ✅ Health check endpoints
+@app.head("/")
+@app.get("/health")
+def health_check():
+    return Response(content=HEALTH_BODY, media_type="application/json")
+
 @app.post("/file")
 def detect_mime(request: AttachmentRequest):
     url = request.attachments.get("url", "")
     
     # Extract MIME type from data URI (format: data:MIME_TYPE;base64,...)
-    if url.startswith("data:"):
-        mime_part = url.split(";")[0].replace("data:", "")
-        main_type = mime_part.split("/")[0]
+    if url.startswith(DATA_PREFIX):
+        start = len(DATA_PREFIX)
+        end = url.find(";", start)
+        if end == -1:
+            end = len(url)
         
-        if main_type in ["image", "text", "application"]:
+        # Main type is everything before the "/" of the MIME type
+        slash = url.find("/", start, end)
+        main_type = url[start:slash if slash != -1 else end]
+        
+        if main_type in VALID_TYPES:
             return {"type": main_type}
     
-    return {"type": "unknown"}
\ No newline at end of file
+    return {"type": "unknown"}
+
+# ✅ API endpoint
+@app.get("/api/outline", response_class=PlainTextResponse)
+async def get_outline(country: str = None):
+    """
+    Get markdown outline of Wikipedia page for a country
+    Query parameter: ?country=CountryName
+    """
+    if not country or country.strip() == "":
+        return "# Error\n\nCountry parameter is required.\n\nUsage: /api/outline?country=CountryName"
+    
+    try:
+        return await build_outline(country)
+    
+    except OutlineError as e:
+        return str(e)
+    
+    except httpx.TimeoutException:
+        return "# Error\n\nRequest timed out"
+    
+    except Exception as e:
+        return f"# Error\n\n{str(e)}"
\ No newline at end of file
@@ -0,0 +1,258 @@
+from fastapi import FastAPI
+import httpx
+import lxml.etree
+import asyncio
+import html
+import re
+from contextlib import asynccontextmanager
+from urllib.parse import quote
+from cachetools import LRUCache, TTLCache
+
+# Add headers to avoid Wikipedia blocking
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, br',
+}
+
+# Shared HTTP client, reused across requests so connections stay warm
+_client: httpx.AsyncClient | None = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _client
+    _client = httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=15,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=300,
+        ),
+    )
+    try:
+        yield
+    finally:
+        await _client.aclose()
+        _client = None
+
+# Conditional-GET cache: page slug -> (etag, last_modified, markdown)
+_page_cache = LRUCache(maxsize=512)
+
+# Rendered outlines served without touching Wikipedia: page slug -> markdown
+_outline_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# Outlines currently being built: page slug -> task shared by all callers
+_inflight: dict[str, asyncio.Task] = {}
+
+# Cap on concurrent requests to Wikipedia
+_wiki_sem = asyncio.Semaphore(8)
+
+class OutlineError(Exception):
+    """
+    Raised with a markdown error message when an outline can't be built
+    """
+
+# Navigation headings left out of the outline
+SKIP_HEADINGS = frozenset(('contents', 'navigation', 'references', 'see also'))
+
+# Markdown prefix for each heading level
+HEADING_PREFIX = ("", "# ", "## ", "### ", "#### ", "##### ", "###### ")
+
+HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+
+# Raw-bytes heading scan over the main content area
+HEADING_RE = re.compile(rb'<h([1-6])\b[^>]*>(.*?)</h\1\s*>', re.S | re.I)
+TAG_RE = re.compile(rb'<[^>]+>')
+CONTENT_START = b'id="mw-content-text"'
+CONTENT_END = b'class="printfooter"'
+
+class HeadingCollector:
+    """
+    lxml parser target that records headings as the HTML is parsed,
+    without building a document tree
+    """
+    def __init__(self):
+        self.depth = 0
+        self.content_depth = None
+        self.seen_content = False
+        self.level = None
+        self.heading_depth = None
+        self.text = []
+        self.content_headings = []
+        self.page_headings = []
+    
+    def start(self, tag, attrib):
+        self.depth += 1
+        
+        if self.level is not None:
+            return
+        
+        # Main content area
+        if tag == "div" and attrib.get("id") == "mw-content-text" and self.content_depth is None:
+            self.content_depth = self.depth
+            self.seen_content = True
+        elif tag in HEADING_TAGS:
+            self.level = int(tag[1])
+            self.heading_depth = self.depth
+            self.text = []
+    
+    def end(self, tag):
+        if self.level is not None and self.depth == self.heading_depth:
+            heading = (self.level, "".join(self.text).strip())
+            self.page_headings.append(heading)
+            if self.content_depth is not None:
+                self.content_headings.append(heading)
+            self.level = None
+        
+        if self.depth == self.content_depth:
+            self.content_depth = None
+        
+        self.depth -= 1
+    
+    def data(self, data):
+        if self.level is not None:
+            self.text.append(data)
+    
+    def close(self):
+        # Fall back to the whole page if the main content area is missing
+        if self.seen_content:
+            return self.content_headings
+        return self.page_headings
+
+def scan_headings(html_content, encoding):
+    """
+    Pull (level, text) headings out of the raw page bytes with a regex,
+    without parsing the document. Returns [] if the content area can't
+    be located, so the caller can fall back to a real parse.
+    """
+    start = html_content.find(CONTENT_START)
+    if start == -1:
+        return []
+    end = html_content.find(CONTENT_END, start)
+    if end == -1:
+        return []
+    
+    return [
+        (int(level), html.unescape(TAG_RE.sub(b"", text).decode(encoding, "replace")).strip())
+        for level, text in HEADING_RE.findall(html_content, start, end)
+    ]
+
+def extract_headings(html_content, encoding='utf-8'):
+    """
+    Return (level, text) tuples for every heading in the page content
+    """
+    headings = scan_headings(html_content, encoding)
+    if headings:
+        return headings
+    
+    # Unexpected markup: fall back to a full parse
+    parser = lxml.etree.HTMLParser(target=HeadingCollector(), encoding=encoding)
+    return lxml.etree.fromstring(html_content, parser)
+
+def page_slug(country):
+    """
+    Turn a country name into its URL-encoded Wikipedia page slug
+    """
+    return quote(country.strip().replace(' ', '_'), safe='_()')
+
+def generate_markdown_outline(headings):
+    """
+    Render (level, text) headings as a markdown outline
+    """
+    # Clean up
+    cleaned = ((level, text.replace('[edit]', '').strip()) for level, text in headings)
+    
+    # Skip empty or navigation headings, then create markdown
+    return "\n\n".join(
+        HEADING_PREFIX[level] + text
+        for level, text in cleaned
+        if text and text.lower() not in SKIP_HEADINGS
+    )
+
+async def fetch_wikipedia_page(slug, cached=None):
+    """
+    Fetch the Wikipedia page for a slug using the shared client and
+    return (response, headings). Headings are parsed in a worker thread
+    so the event loop keeps serving other requests; headings is None
+    unless the status is 200.
+    If a cached entry is given, the request is made conditional so
+    Wikipedia can answer 304 Not Modified without a body.
+    """
+    url = f"https://en.wikipedia.org/wiki/{slug}"
+    
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    # Be polite: limit how many requests hit Wikipedia at once
+    async with _wiki_sem:
+        response = await _client.get(url, headers=headers)
+    if response.status_code != 200:
+        return response, None
+    
+    # Wikipedia always serves UTF-8, so don't make libxml2 sniff <meta> tags
+    encoding = response.charset_encoding or 'utf-8'
+    headings = await asyncio.to_thread(extract_headings, response.content, encoding)
+    return response, headings
+
+async def build_outline(country):
+    """
+    Return the outline for a country, using the caches. Concurrent
+    requests for the same page share a single fetch.
+    """
+    slug = page_slug(country)
+    
+    outline = _outline_cache.get(slug)
+    if outline is not None:
+        return outline
+    
+    task = _inflight.get(slug)
+    if task is None:
+        task = asyncio.create_task(fetch_outline(country, slug))
+        _inflight[slug] = task
+        task.add_done_callback(lambda _: _inflight.pop(slug, None))
+    
+    # Shield so one caller disconnecting doesn't cancel the others
+    return await asyncio.shield(task)
+
+async def fetch_outline(country, slug):
+    """
+    Fetch, parse and render the outline for a page slug
+    """
+    cached = _page_cache.get(slug)
+    
+    # Fetch Wikipedia page and extract headings
+    response, headings = await fetch_wikipedia_page(slug, cached)
+    
+    # Page unchanged since we last rendered it
+    if response.status_code == 304 and cached:
+        outline = cached[2]
+    else:
+        if response.status_code == 404:
+            raise OutlineError(f"# Error\n\nWikipedia page not found for '{country}'")
+        
+        if response.status_code != 200:
+            raise OutlineError(f"# Error\n\nHTTP Error {response.status_code}")
+        
+        if not headings:
+            raise OutlineError(f"# {country}\n\nNo headings found on Wikipedia page.")
+        
+        outline = generate_markdown_outline(headings)
+        
+        if not outline:
+            raise OutlineError(f"# {country}\n\nNo valid headings found.")
+        
+        _page_cache[slug] = (
+            response.headers.get('etag'),
+            response.headers.get('last-modified'),
+            outline,
+        )
+    
+    _outline_cache[slug] = outline
+    return outline